@@ -89,11 +89,18 @@ def _meta_from_file(meta_path: Path) -> Generator[dict, None, None]:
         print(f"WARNING: skip {meta_path} file")
         return
     with open(meta_path) as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            if not isinstance(row, dict):
-                raise RuntimeError(f"ERROR: wrong row '{row}' in {meta_path}")
-            yield row
+        # csv.reader with the header zipped to each row is cheaper than csv.DictReader
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if not header:
+            return
+        for values in reader:
+            if not values:
+                # empty lines are skipped as csv.DictReader does
+                continue
+            if len(header) != len(values):
+                raise RuntimeError(f"ERROR: wrong row '{values}' in {meta_path}")
+            yield dict(zip(header, values))
 
 
 def _meta_from_dir(meta_path: Path) -> Generator[dict, None, None]: